@@ -3,21 +3,165 @@ Dashboard Router
 Provides aggregated statistics and metrics for the dashboard
 """
 
-from fastapi import APIRouter, BackgroundTasks
-from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
+import asyncio
+import time
+from functools import wraps
+from fastapi import APIRouter, BackgroundTasks, Request, Response
+from fastapi.responses import ORJSONResponse
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
+import msgspec
+import orjson
 import redis.asyncio as redis
 from loguru import logger
 
-router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
+from ...core.http_cache import compute_etag, etag_json_response
+
+router = APIRouter(
+    prefix="/dashboard",
+    tags=["Dashboard"],
+    default_response_class=ORJSONResponse,
+)
 
 # Redis connection
 REDIS_HOST = "redis_broker"
 REDIS_PORT = 6379
 
+# Shared pool so health checks reuse connections instead of reconnecting per request
+REDIS_POOL = redis.ConnectionPool(
+    host=REDIS_HOST,
+    port=REDIS_PORT,
+    decode_responses=True,
+    max_connections=32,
+)
+
+# Upper bound on the Redis probe so a slow broker can't stall the dashboard refresh
+REDIS_HEALTH_TIMEOUT = 0.25
+
+# Latest Redis probe result, shared by all health requests for REDIS_HEALTH_TTL seconds
+REDIS_HEALTH_TTL = 1.0
+_redis_health_cache: Dict[str, Any] = {"expiry": 0.0, "value": None, "lock": asyncio.Lock()}
+
+# Process-local response cache: (endpoint, params) -> (expiry, serialized body)
+_RESPONSE_CACHE: Dict[Tuple, Tuple[float, bytes]] = {}
+
+
+def async_ttl_cache(ttl_seconds: float):
+    """
+    Cache a dashboard handler's JSON body for a short time.
+
+    The dashboard tiles poll these endpoints on every auto-refresh, so the
+    serialized payload is kept per (endpoint, query params) and served as-is
+    until it expires. Only successful payloads are cached. Payloads are
+    encoded with msgspec so handlers can return Structs directly.
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(**kwargs):
+            key = (func.__name__, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+
+            cached = _RESPONSE_CACHE.get(key)
+            if cached is not None and cached[0] > now:
+                return Response(content=cached[1], media_type="application/json")
+
+            payload = await func(**kwargs)
+            body = msgspec.json.encode(payload)
+            if payload.get("status") == "success":
+                _RESPONSE_CACHE[key] = (now + ttl_seconds, body)
+
+            return Response(content=body, media_type="application/json")
+
+        return wrapper
+
+    return decorator
+
+
+# Background-refreshed dashboard payloads: "<name>" -> data, "<name>_body" -> JSON bytes,
+# "<name>_etag" -> ETag of the body
+DASHBOARD_REFRESH_INTERVAL = 1.0
+_DASHBOARD_CACHE: Dict[str, Any] = {}
+
+# Relative timestamps used by the mock feeds, re-rendered once per refresh tick
+_TIMESTAMP_OFFSETS: Dict[str, timedelta] = {
+    "m2": timedelta(minutes=2),
+    "m5": timedelta(minutes=5),
+    "m15": timedelta(minutes=15),
+    "m30": timedelta(minutes=30),
+    "h1": timedelta(hours=1),
+    "h2": timedelta(hours=2),
+}
+_TIMESTAMPS: Dict[str, str] = {}
+_refresh_task: Optional[asyncio.Task] = None
+
+
+def _refresh_dashboard_cache_once() -> None:
+    """Rebuild every background-cached payload and its serialized response body."""
+    now = datetime.now()
+    for key, offset in _TIMESTAMP_OFFSETS.items():
+        _TIMESTAMPS[key] = (now - offset).isoformat()
+
+    payloads = {
+        "stats": _build_dashboard_stats(),
+        "network_overview": _build_network_overview(),
+        "recent_jobs": _build_recent_jobs(),
+        "activity": _build_activity_feed(),
+        "storage": _build_storage_stats(),
+    }
+    for name, data in payloads.items():
+        body = orjson.dumps({"status": "success", "data": data})
+        _DASHBOARD_CACHE[name] = data
+        _DASHBOARD_CACHE[f"{name}_body"] = body
+        _DASHBOARD_CACHE[f"{name}_etag"] = compute_etag(body)
+
+
+async def refresh_dashboard_cache() -> None:
+    """Keep the dashboard payloads fresh so request handlers only read them."""
+    while True:
+        try:
+            _refresh_dashboard_cache_once()
+        except Exception as e:
+            logger.error(f"Error refreshing dashboard cache: {e}")
+        await asyncio.sleep(DASHBOARD_REFRESH_INTERVAL)
+
+
+def _get_dashboard_cache() -> Dict[str, Any]:
+    """Return the payload cache, filling it if the refresher has not run yet."""
+    if not _DASHBOARD_CACHE:
+        _refresh_dashboard_cache_once()
+    return _DASHBOARD_CACHE
+
+
+def _cached_response(name: str, request: Optional[Request] = None) -> Response:
+    """
+    Serve a background-cached payload as a pre-encoded JSON response.
+
+    When the request is passed, the response carries an ETag and a matching
+    If-None-Match is answered with 304.
+    """
+    cache = _get_dashboard_cache()
+    if request is not None:
+        return etag_json_response(request, cache[f"{name}_body"], cache[f"{name}_etag"])
+    return Response(content=cache[f"{name}_body"], media_type="application/json")
+
+
+@router.on_event("startup")
+async def start_dashboard_refresher():
+    """Start the background task that rebuilds the dashboard payloads."""
+    global _refresh_task
+    if _refresh_task is None or _refresh_task.done():
+        _refresh_task = asyncio.create_task(refresh_dashboard_cache())
+        logger.info("Dashboard cache refresher started")
 
-class DashboardStats(BaseModel):
+
+@router.on_event("shutdown")
+async def stop_dashboard_refresher():
+    """Cancel the dashboard cache refresher."""
+    if _refresh_task is not None:
+        _refresh_task.cancel()
+
+
+class DashboardStats(msgspec.Struct):
     """Dashboard quick statistics"""
     total_jobs: int
     jobs_today: int
@@ -29,7 +173,7 @@ class DashboardStats(BaseModel):
     jobs_this_month: int
 
 
-class ServiceHealth(BaseModel):
+class ServiceHealth(msgspec.Struct, kw_only=True, omit_defaults=True):
     """Service health status"""
     name: str
     status: str  # healthy, unhealthy, degraded, pending
@@ -39,7 +183,7 @@ class ServiceHealth(BaseModel):
     last_check: str
 
 
-class JobSummary(BaseModel):
+class JobSummary(msgspec.Struct):
     """Job summary for recent jobs table"""
     job_id: str
     job_type: str
@@ -49,6 +193,26 @@ class JobSummary(BaseModel):
     timestamp: str
 
 
+def _build_dashboard_stats() -> Dict[str, Any]:
+    """Build the quick statistics payload (mock data for now)."""
+    # In production this would query the database or Redis for actual metrics
+    return {
+        "total_jobs": 127,
+        "jobs_today": 15,
+        "success_rate": 98.5,
+        "active_connections": 3,
+        "pending_jobs": 0,
+        "avg_job_duration": 1.2,
+        "jobs_this_week": 89,
+        "jobs_this_month": 342,
+        "trends": {
+            "jobs_today_change": "+12%",
+            "success_rate_change": "+0.3%",
+            "avg_duration_change": "-0.2s"
+        }
+    }
+
+
 @router.get("/stats")
 async def get_dashboard_stats():
     """
@@ -57,33 +221,52 @@ async def get_dashboard_stats():
     Returns overall metrics about job executions, success rates,
     and system performance indicators.
     """
-    try:
-        # For now, return mock data - in production this would query the database
-        # or Redis for actual metrics
-        stats = {
-            "total_jobs": 127,
-            "jobs_today": 15,
-            "success_rate": 98.5,
-            "active_connections": 3,
-            "pending_jobs": 0,
-            "avg_job_duration": 1.2,
-            "jobs_this_week": 89,
-            "jobs_this_month": 342,
-            "trends": {
-                "jobs_today_change": "+12%",
-                "success_rate_change": "+0.3%",
-                "avg_duration_change": "-0.2s"
-            }
-        }
+    return _cached_response("stats")
 
-        return {"status": "success", "data": stats}
 
-    except Exception as e:
-        logger.error(f"Error fetching dashboard stats: {e}")
-        return {"status": "error", "message": str(e)}
+async def _probe_redis() -> Dict[str, Any]:
+    """Ping Redis and fetch its memory INFO in a single pipelined round-trip."""
+    r = redis.Redis(connection_pool=REDIS_POOL)
+    async with r.pipeline(transaction=False) as pipe:
+        pipe.ping()
+        pipe.info("memory")
+        _, info = await pipe.execute()
+    return info
+
+
+async def _get_redis_health() -> Tuple[bool, str]:
+    """
+    Return (healthy, description) for the Redis broker.
+
+    The probe result is cached for REDIS_HEALTH_TTL seconds, and concurrent
+    callers wait on the single in-flight probe instead of each querying Redis.
+    """
+    cache = _redis_health_cache
+    if time.monotonic() < cache["expiry"]:
+        return cache["value"]
+
+    async with cache["lock"]:
+        # Another request may have refreshed the entry while we waited
+        if time.monotonic() < cache["expiry"]:
+            return cache["value"]
+
+        try:
+            info = await asyncio.wait_for(_probe_redis(), timeout=REDIS_HEALTH_TIMEOUT)
+            used_memory = int(info.get("used_memory", 0))
+            memory_used = f"{used_memory / 1024 / 1024:.1f}MB"
+            value = (True, f"Message queue and pub/sub ({memory_used} used)")
+        except asyncio.TimeoutError:
+            value = (False, f"Health check timed out after {REDIS_HEALTH_TIMEOUT}s")
+        except Exception as e:
+            value = (False, f"Connection failed: {str(e)}")
+
+        cache["value"] = value
+        cache["expiry"] = time.monotonic() + REDIS_HEALTH_TTL
+        return value
 
 
 @router.get("/health")
+@async_ttl_cache(ttl_seconds=2)
 async def get_service_health():
     """
     Get health status of all Aether services.
@@ -92,61 +275,57 @@ async def get_service_health():
     Rust WebSocket Hub, Redis, and Worker Service.
     """
     try:
+        now_iso = datetime.now().isoformat()
         services = []
 
         # FastAPI Gateway Health
-        services.append({
-            "name": "FastAPI Gateway",
-            "status": "healthy",
-            "description": "API Gateway on port 8000",
-            "response_time": "12ms",
-            "uptime": "99.9%",
-            "last_check": datetime.now().isoformat()
-        })
+        services.append(ServiceHealth(
+            name="FastAPI Gateway",
+            status="healthy",
+            description="API Gateway on port 8000",
+            response_time="12ms",
+            uptime="99.9%",
+            last_check=now_iso
+        ))
 
         # Rust WebSocket Hub Health
-        services.append({
-            "name": "WebSocket Hub",
-            "status": "healthy",
-            "description": "Rust WebSocket service on port 3100",
-            "response_time": "5ms",
-            "uptime": "99.8%",
-            "last_check": datetime.now().isoformat()
-        })
+        services.append(ServiceHealth(
+            name="WebSocket Hub",
+            status="healthy",
+            description="Rust WebSocket service on port 3100",
+            response_time="5ms",
+            uptime="99.8%",
+            last_check=now_iso
+        ))
 
         # Redis Broker Health
-        try:
-            r = await redis.Redis(host=REDIS_HOST, port=REDIS_PORT, decode_responses=True)
-            await r.ping()
-            info = await r.info()
-            memory_used = info.get('used_memory_human', 'N/A')
-
-            services.append({
-                "name": "Redis Broker",
-                "status": "healthy",
-                "description": f"Message queue and pub/sub ({memory_used} used)",
-                "response_time": "2ms",
-                "uptime": "99.9%",
-                "last_check": datetime.now().isoformat()
-            })
-            await r.close()
-        except Exception as e:
-            services.append({
-                "name": "Redis Broker",
-                "status": "unhealthy",
-                "description": f"Connection failed: {str(e)}",
-                "last_check": datetime.now().isoformat()
-            })
+        redis_healthy, redis_description = await _get_redis_health()
+        if redis_healthy:
+            services.append(ServiceHealth(
+                name="Redis Broker",
+                status="healthy",
+                description=redis_description,
+                response_time="2ms",
+                uptime="99.9%",
+                last_check=now_iso
+            ))
+        else:
+            services.append(ServiceHealth(
+                name="Redis Broker",
+                status="unhealthy",
+                description=redis_description,
+                last_check=now_iso
+            ))
 
         # Worker Service Health (assumed running)
-        services.append({
-            "name": "Worker Service",
-            "status": "healthy",
-            "description": "Background job processor",
-            "response_time": "N/A",
-            "uptime": "99.5%",
-            "last_check": datetime.now().isoformat()
-        })
+        services.append(ServiceHealth(
+            name="Worker Service",
+            status="healthy",
+            description="Background job processor",
+            response_time="N/A",
+            uptime="99.5%",
+            last_check=now_iso
+        ))
 
         return {"status": "success", "data": services}
 
@@ -155,6 +334,53 @@ async def get_service_health():
         return {"status": "error", "message": str(e)}
 
 
+def _build_recent_jobs() -> List[Dict[str, Any]]:
+    """Build the recent jobs list (mock data for now)."""
+    # In production, this would query Redis or a database
+    return [
+        {
+            "job_id": "job-abc123-def",
+            "job_type": "Device Report",
+            "device": "srx320-01",
+            "status": "completed",
+            "duration": 2.3,
+            "timestamp": _TIMESTAMPS["m5"]
+        },
+        {
+            "job_id": "job-xyz789-ghi",
+            "job_type": "JSNAPy Validation",
+            "device": "mx960-core",
+            "status": "running",
+            "duration": None,
+            "timestamp": _TIMESTAMPS["m2"]
+        },
+        {
+            "job_id": "job-def456-klm",
+            "job_type": "Backup",
+            "device": "ex4300-access",
+            "status": "completed",
+            "duration": 45.7,
+            "timestamp": _TIMESTAMPS["m15"]
+        },
+        {
+            "job_id": "job-ghi789-nop",
+            "job_type": "Software Upgrade",
+            "device": "srx320-02",
+            "status": "failed",
+            "duration": 120.5,
+            "timestamp": _TIMESTAMPS["h1"]
+        },
+        {
+            "job_id": "job-klm012-qrs",
+            "job_type": "Device Report",
+            "device": "qfx5100-01",
+            "status": "completed",
+            "duration": 1.8,
+            "timestamp": _TIMESTAMPS["h2"]
+        }
+    ]
+
+
 @router.get("/recent-jobs")
 async def get_recent_jobs(limit: int = 10):
     """
@@ -163,57 +389,76 @@ async def get_recent_jobs(limit: int = 10):
     Returns a list of recently executed or running jobs
     with their status and metadata.
     """
-    try:
-        # For now, return mock data
-        # In production, this would query Redis or a database
-        jobs = [
-            {
+    jobs = _get_dashboard_cache()["recent_jobs"]
+    if limit >= len(jobs):
+        return _cached_response("recent_jobs")
+    return ORJSONResponse({"status": "success", "data": jobs[:limit]})
+
+
+def _build_activity_feed() -> List[Dict[str, Any]]:
+    """Build the activity feed (mock data for now)."""
+    # In production, this would query Redis pub/sub history or event store
+    return [
+        {
+            "id": "act-001",
+            "type": "JOB_COMPLETE",
+            "message": "Device report completed successfully for srx320-01",
+            "severity": "info",
+            "timestamp": _TIMESTAMPS["m5"],
+            "metadata": {
                 "job_id": "job-abc123-def",
                 "job_type": "Device Report",
-                "device": "srx320-01",
-                "status": "completed",
-                "duration": 2.3,
-                "timestamp": (datetime.now() - timedelta(minutes=5)).isoformat()
-            },
-            {
+                "device": "srx320-01"
+            }
+        },
+        {
+            "id": "act-002",
+            "type": "JOB_STARTED",
+            "message": "JSNAPy validation started for mx960-core",
+            "severity": "info",
+            "timestamp": _TIMESTAMPS["m2"],
+            "metadata": {
                 "job_id": "job-xyz789-ghi",
                 "job_type": "JSNAPy Validation",
-                "device": "mx960-core",
-                "status": "running",
-                "duration": None,
-                "timestamp": (datetime.now() - timedelta(minutes=2)).isoformat()
-            },
-            {
+                "device": "mx960-core"
+            }
+        },
+        {
+            "id": "act-003",
+            "type": "JOB_COMPLETE",
+            "message": "Backup completed for ex4300-access",
+            "severity": "info",
+            "timestamp": _TIMESTAMPS["m15"],
+            "metadata": {
                 "job_id": "job-def456-klm",
                 "job_type": "Backup",
-                "device": "ex4300-access",
-                "status": "completed",
-                "duration": 45.7,
-                "timestamp": (datetime.now() - timedelta(minutes=15)).isoformat()
-            },
-            {
+                "device": "ex4300-access"
+            }
+        },
+        {
+            "id": "act-004",
+            "type": "JOB_FAILED",
+            "message": "Software upgrade failed for srx320-02: Insufficient storage",
+            "severity": "error",
+            "timestamp": _TIMESTAMPS["h1"],
+            "metadata": {
                 "job_id": "job-ghi789-nop",
                 "job_type": "Software Upgrade",
                 "device": "srx320-02",
-                "status": "failed",
-                "duration": 120.5,
-                "timestamp": (datetime.now() - timedelta(hours=1)).isoformat()
-            },
-            {
-                "job_id": "job-klm012-qrs",
-                "job_type": "Device Report",
-                "device": "qfx5100-01",
-                "status": "completed",
-                "duration": 1.8,
-                "timestamp": (datetime.now() - timedelta(hours=2)).isoformat()
+                "error": "Insufficient storage space"
             }
-        ]
-
-        return {"status": "success", "data": jobs[:limit]}
-
-    except Exception as e:
-        logger.error(f"Error fetching recent jobs: {e}")
-        return {"status": "error", "message": str(e)}
+        },
+        {
+            "id": "act-005",
+            "type": "SYSTEM",
+            "message": "WebSocket Hub connected 3 clients",
+            "severity": "info",
+            "timestamp": _TIMESTAMPS["m30"],
+            "metadata": {
+                "connections": 3
+            }
+        }
+    ]
 
 
 @router.get("/activity")
@@ -224,152 +469,81 @@ async def get_activity_feed(limit: int = 20):
     Returns a feed of recent events from the WebSocket system,
     including job completions, failures, and system notifications.
     """
-    try:
-        # For now, return mock activity data
-        # In production, this would query Redis pub/sub history or event store
-        activities = [
-            {
-                "id": "act-001",
-                "type": "JOB_COMPLETE",
-                "message": "Device report completed successfully for srx320-01",
-                "severity": "info",
-                "timestamp": (datetime.now() - timedelta(minutes=5)).isoformat(),
-                "metadata": {
-                    "job_id": "job-abc123-def",
-                    "job_type": "Device Report",
-                    "device": "srx320-01"
-                }
-            },
-            {
-                "id": "act-002",
-                "type": "JOB_STARTED",
-                "message": "JSNAPy validation started for mx960-core",
-                "severity": "info",
-                "timestamp": (datetime.now() - timedelta(minutes=2)).isoformat(),
-                "metadata": {
-                    "job_id": "job-xyz789-ghi",
-                    "job_type": "JSNAPy Validation",
-                    "device": "mx960-core"
-                }
-            },
-            {
-                "id": "act-003",
-                "type": "JOB_COMPLETE",
-                "message": "Backup completed for ex4300-access",
-                "severity": "info",
-                "timestamp": (datetime.now() - timedelta(minutes=15)).isoformat(),
-                "metadata": {
-                    "job_id": "job-def456-klm",
-                    "job_type": "Backup",
-                    "device": "ex4300-access"
-                }
-            },
-            {
-                "id": "act-004",
-                "type": "JOB_FAILED",
-                "message": "Software upgrade failed for srx320-02: Insufficient storage",
-                "severity": "error",
-                "timestamp": (datetime.now() - timedelta(hours=1)).isoformat(),
-                "metadata": {
-                    "job_id": "job-ghi789-nop",
-                    "job_type": "Software Upgrade",
-                    "device": "srx320-02",
-                    "error": "Insufficient storage space"
-                }
-            },
-            {
-                "id": "act-005",
-                "type": "SYSTEM",
-                "message": "WebSocket Hub connected 3 clients",
-                "severity": "info",
-                "timestamp": (datetime.now() - timedelta(minutes=30)).isoformat(),
-                "metadata": {
-                    "connections": 3
-                }
-            }
-        ]
-
-        return {"status": "success", "data": activities[:limit]}
-
-    except Exception as e:
-        logger.error(f"Error fetching activity feed: {e}")
-        return {"status": "error", "message": str(e)}
+    activities = _get_dashboard_cache()["activity"]
+    if limit >= len(activities):
+        return _cached_response("activity")
+    return ORJSONResponse({"status": "success", "data": activities[:limit]})
+
+
+def _build_network_overview() -> Dict[str, Any]:
+    """Build the device inventory overview (mock data for now)."""
+    # In production, this would query the device inventory
+    return {
+        "total_devices": 65,
+        "by_platform": {
+            "EX": 45,
+            "MX": 12,
+            "SRX": 8
+        },
+        "device_health": {
+            "healthy": 62,
+            "unreachable": 3
+        },
+        "backup_coverage": {
+            "backed_up": 58,
+            "needs_backup": 7
+        },
+        "recent_changes": {
+            "added": 2,
+            "removed": 0,
+            "modified": 5
+        }
+    }
 
 
 @router.get("/network-overview")
-async def get_network_overview():
+async def get_network_overview(request: Request):
     """
     Get network device overview statistics.
 
     Returns information about device inventory, platform distribution,
     and device health status.
     """
-    try:
-        # For now, return mock data
-        # In production, this would query the device inventory
-        overview = {
-            "total_devices": 65,
-            "by_platform": {
-                "EX": 45,
-                "MX": 12,
-                "SRX": 8
-            },
-            "device_health": {
-                "healthy": 62,
-                "unreachable": 3
-            },
-            "backup_coverage": {
-                "backed_up": 58,
-                "needs_backup": 7
-            },
-            "recent_changes": {
-                "added": 2,
-                "removed": 0,
-                "modified": 5
-            }
+    return _cached_response("network_overview", request)
+
+
+def _build_storage_stats() -> Dict[str, Any]:
+    """Build the storage and resource usage payload (mock data for now)."""
+    return {
+        "redis_memory": {
+            "used": "245MB",
+            "available": "5.7GB",
+            "percentage": 4
+        },
+        "disk_backup": {
+            "used": "127GB",
+            "available": "873GB",
+            "percentage": 13
+        },
+        "disk_uploads": {
+            "used": "2.3GB",
+            "available": "17.7GB",
+            "percentage": 11
+        },
+        "temp_storage": {
+            "used": "45MB",
+            "file_count": 12,
+            "description": "Temporary upload storage"
         }
-
-        return {"status": "success", "data": overview}
-
-    except Exception as e:
-        logger.error(f"Error fetching network overview: {e}")
-        return {"status": "error", "message": str(e)}
+    }
 
 
 @router.get("/storage")
-async def get_storage_stats():
+async def get_storage_stats(request: Request):
     """
     Get storage and resource usage statistics.
 
     Returns information about disk usage, Redis memory, and
     temporary storage consumption.
     """
-    try:
-        storage = {
-            "redis_memory": {
-                "used": "245MB",
-                "available": "5.7GB",
-                "percentage": 4
-            },
-            "disk_backup": {
-                "used": "127GB",
-                "available": "873GB",
-                "percentage": 13
-            },
-            "disk_uploads": {
-                "used": "2.3GB",
-                "available": "17.7GB",
-                "percentage": 11
-            },
-            "temp_storage": {
-                "used": "45MB",
-                "file_count": 12,
-                "description": "Temporary upload storage"
-            }
-        }
-
-        return {"status": "success", "data": storage}
-
-    except Exception as e:
-        logger.error(f"Error fetching storage stats: {e}")
-        return {"status": "error", "message": str(e)}
+    return _cached_response("storage", request)
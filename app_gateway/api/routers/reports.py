@@ -5,11 +5,26 @@ Defines all HTTP endpoints related to device report generation.
 
 import uuid
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+import msgspec
+import orjson
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Request, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from loguru import logger
 
-router = APIRouter(prefix="/reports", tags=["Device Reports"])
+from ...core.http_cache import compute_etag, etag_json_response
+
+try:
+    from app_gateway.services.reports_service import execute_report_generation
+except ImportError as e:
+    logger.error(f"Failed to import reports service: {e}")
+    execute_report_generation = None
+
+router = APIRouter(
+    prefix="/reports",
+    tags=["Device Reports"],
+    default_response_class=ORJSONResponse,
+)
 
 
 class ReportRequest(BaseModel):
@@ -20,8 +35,10 @@ class ReportRequest(BaseModel):
     report_types: List[str]
     inventory_file: Optional[str] = None
 
+    model_config = {"extra": "forbid", "validate_assignment": False}
 
-class ReportTypeResponse(BaseModel):
+
+class ReportTypeResponse(msgspec.Struct):
     """Response model for report type information."""
     id: str
     name: str
@@ -107,9 +124,25 @@ REPORT_TYPES = [
     },
 ]
 
+# REPORT_TYPES is static, so the validation set and the static bodies are built once
+VALID_REPORT_IDS = frozenset(rt["id"] for rt in REPORT_TYPES)
+# The static table is checked against ReportTypeResponse once, at import
+REPORT_TYPES_BODY = msgspec.json.encode({
+    "status": "success",
+    "total": len(REPORT_TYPES),
+    "report_types": msgspec.convert(REPORT_TYPES, List[ReportTypeResponse])
+})
+REPORT_TYPES_ETAG = compute_etag(REPORT_TYPES_BODY)
+HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": "Device Reports Generator",
+    "version": "1.0.0",
+    "available_reports": len(REPORT_TYPES)
+})
+
 
 @router.get("/types")
-async def get_report_types():
+async def get_report_types(request: Request):
     """
     Get all available report types.
 
@@ -117,11 +150,7 @@ async def get_report_types():
     including their metadata and required commands.
     """
     logger.info("Fetching available report types")
-    return {
-        "status": "success",
-        "total": len(REPORT_TYPES),
-        "report_types": REPORT_TYPES
-    }
+    return etag_json_response(request, REPORT_TYPES_BODY, REPORT_TYPES_ETAG)
 
 
 @router.post("/generate")
@@ -144,59 +173,57 @@ async def generate_reports(req: ReportRequest, background_tasks: BackgroundTasks
         ws_channel: WebSocket channel for real-time updates
         status: Initial job status
     """
-    job_id = str(uuid.uuid4())
+    job_id = uuid.uuid4().hex
+    ws_channel = f"job:{job_id}"
+
+    logger.info(
+        "Received report generation request for job {} (device: {}, report types: {})",
+        job_id, req.hostname, req.report_types
+    )
 
-    logger.info(f"Received report generation request for job {job_id}")
-    logger.info(f"Target device: {req.hostname}")
-    logger.info(f"Report types: {req.report_types}")
+    # Drop duplicate ids (keeping request order) so no report is generated twice
+    report_types = list(dict.fromkeys(req.report_types))
+    total_reports = len(report_types)
 
     # Validate report types
-    valid_report_ids = {rt["id"] for rt in REPORT_TYPES}
-    invalid_types = [rt for rt in req.report_types if rt not in valid_report_ids]
+    invalid_types = [rt for rt in report_types if rt not in VALID_REPORT_IDS]
 
     if invalid_types:
         logger.warning(f"Invalid report types requested: {invalid_types}")
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid report types: {invalid_types}. Valid types are: {list(valid_report_ids)}"
+            detail=f"Invalid report types: {invalid_types}. Valid types are: {list(VALID_REPORT_IDS)}"
         )
 
-    if not req.report_types:
+    if not total_reports:
         logger.warning("No report types specified")
         raise HTTPException(
             status_code=400,
             detail="At least one report type must be specified"
         )
 
-    # Import here to avoid circular dependencies
-    try:
-        from app_gateway.services.reports_service import execute_report_generation
-
-        # Queue the background task
-        async def run_report_job():
-            await execute_report_generation(
-                job_id=job_id,
-                hostname=req.hostname,
-                username=req.username,
-                password=req.password,
-                report_types=req.report_types
-            )
-
-        background_tasks.add_task(run_report_job)
-
-    except ImportError as e:
-        logger.error(f"Failed to import reports service: {e}")
+    if execute_report_generation is None:
         raise HTTPException(
             status_code=500,
             detail="Report generation service not available. Please ensure the service is properly configured."
         )
 
+    # Queue the background task (BackgroundTasks awaits the coroutine function directly)
+    background_tasks.add_task(
+        execute_report_generation,
+        job_id=job_id,
+        hostname=req.hostname,
+        username=req.username,
+        password=req.password,
+        report_types=report_types
+    )
+
     return {
         "job_id": job_id,
-        "ws_channel": f"job:{job_id}",
+        "ws_channel": ws_channel,
         "status": "queued",
-        "message": f"Report generation started for {len(req.report_types)} report types",
-        "total_reports": len(req.report_types)
+        "message": f"Report generation started for {total_reports} report types",
+        "total_reports": total_reports
     }
 
 
@@ -228,9 +255,4 @@ async def health_check():
     """
     Health check endpoint for the reports service.
     """
-    return {
-        "status": "healthy",
-        "service": "Device Reports Generator",
-        "version": "1.0.0",
-        "available_reports": len(REPORT_TYPES)
-    }
+    return Response(content=HEALTH_BODY, media_type="application/json")
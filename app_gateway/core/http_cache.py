@@ -0,0 +1,43 @@
+# File Path: fastapi_automation/core/http_cache.py
+"""
+HTTP Cache Helpers
+ETag / If-None-Match handling for endpoints that serve pre-encoded JSON bodies.
+"""
+
+import hashlib
+
+from fastapi import Request, Response
+
+
+def compute_etag(body: bytes) -> str:
+    """
+    Return a weak ETag for a response body. It is weak because GZipMiddleware
+    may serve the same tag on a gzip-encoded copy of the body.
+    """
+    return f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """
+    Check whether the client's If-None-Match header already covers ``etag``,
+    using the weak comparison If-None-Match calls for.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    opaque_tag = etag.removeprefix("W/")
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == opaque_tag:
+            return True
+    return False
+
+
+def etag_json_response(request: Request, body: bytes, etag: str) -> Response:
+    """
+    Serve a pre-encoded JSON body, or an empty 304 if the client's copy is current.
+    """
+    headers = {"ETag": etag}
+    if is_not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -18,6 +18,8 @@ UPDATES:
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from loguru import logger
 import sys
 
@@ -127,6 +129,8 @@ app = FastAPI(
     title=settings.APP_TITLE,  # Application title from configuration
     version="1.0.0",  # API version
     description="Centralized API Gateway for network automation services.",
+    # Serialize every router's plain-dict responses with orjson by default.
+    default_response_class=ORJSONResponse,
     # OpenAPI documentation will be available at /docs and /redoc by default.
 )
 
@@ -155,6 +159,13 @@ app.add_middleware(
     allow_headers=["*"],  # Allow all request headers.
 )
 
+# =============================================================================
+# GZIP COMPRESSION MIDDLEWARE
+# =============================================================================
+# Compresses larger JSON bodies (e.g., dashboard activity and recent-jobs feeds)
+# for clients that send "Accept-Encoding: gzip". Small responses are sent as-is.
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
 # =============================================================================
 # ROUTER REGISTRATION WITH PRIORITY ORDERING
 # =============================================================================
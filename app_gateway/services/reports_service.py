@@ -6,23 +6,19 @@ for real device connections and command execution on Juniper EX, MX, and SRX pla
 """
 
 import asyncio
-import sys
 import json
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from loguru import logger
 
 # Import configuration
 from ..core.config import settings
 from .websocket import publish_to_redis
 
-# Add the reports_generator to path
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '../../frontend/reports_generator'))
-
-# Import the report generator
+# Import the report generator (frontend/reports_generator is installed as the
+# top-level "reports_generator" package next to app_gateway)
 try:
-    from report_generator import DeviceReportGenerator
+    from reports_generator import DeviceReportGenerator
     REPORT_GENERATOR_AVAILABLE = True
 except ImportError as e:
     logger.warning(f"Report generator module not available: {e}")
@@ -32,6 +28,103 @@ except ImportError as e:
 REDIS_HOST = settings.REDIS_HOST
 REDIS_PORT = int(settings.REDIS_PORT)
 
+# Status update batching: publish at most this many updates per Redis message,
+# and hold a partial batch no longer than the flush interval (seconds)
+STATUS_BATCH_MAX_SIZE = 50
+STATUS_BATCH_FLUSH_INTERVAL = 0.05
+
+# Queue marker asking the publisher to send whatever it is holding right away
+_FLUSH = object()
+
+
+class StatusPublisher:
+    """
+    Coalesces the status updates of one job into batched Redis publishes.
+
+    Updates are queued with enqueue() and drained by a background task that
+    publishes up to STATUS_BATCH_MAX_SIZE of them at once, or whatever arrived
+    within STATUS_BATCH_FLUSH_INTERVAL. A lone update is published unchanged;
+    several go out as a single {"batch": [...]} message.
+    """
+
+    def __init__(
+        self,
+        ws_channel: str,
+        max_batch: int = STATUS_BATCH_MAX_SIZE,
+        flush_interval: float = STATUS_BATCH_FLUSH_INTERVAL
+    ):
+        self.ws_channel = ws_channel
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def enqueue(self, message: Dict[str, Any]):
+        """Queue a status update, starting the background publisher if needed."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        self._queue.put_nowait(message)
+
+    async def flush(self):
+        """Publish everything queued so far without waiting out the interval."""
+        if self._task is None:
+            return
+        self._queue.put_nowait(_FLUSH)
+        await self._queue.join()
+
+    async def close(self):
+        """Flush pending updates and stop the background publisher."""
+        if self._task is None:
+            return
+        await self.flush()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._queue.get()
+            received = 1
+            batch = []
+            deadline = loop.time() + self.flush_interval
+
+            while item is not _FLUSH:
+                batch.append(item)
+                timeout = deadline - loop.time()
+                if len(batch) >= self.max_batch or timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                received += 1
+
+            if batch:
+                message = batch[0] if len(batch) == 1 else {"batch": batch}
+                await publish_status_update(self.ws_channel, message)
+
+            for _ in range(received):
+                self._queue.task_done()
+
+
+def _status_event(
+    job_id: str,
+    step: str,
+    message: str,
+    progress: int,
+    status: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build a "status" event in the shape the DeviceReports page consumes."""
+    event: Dict[str, Any] = {"event_type": "status", "job_id": job_id}
+    if status is not None:
+        event["status"] = status
+    event["data"] = {"step": step, "message": message, "progress": progress}
+    return event
+
 
 async def execute_report_generation(
     job_id: str,
@@ -61,6 +154,11 @@ async def execute_report_generation(
     ws_channel = f"ws_channel:job:{job_id}"
     start_time = datetime.now()
     total_reports = len(report_types)
+    # Progress ticks and terminal events go to separate channel shards so
+    # subscribers that only need completions never receive the ticks
+    progress = StatusPublisher(f"{ws_channel}:progress")
+    terminal = StatusPublisher(f"{ws_channel}:terminal")
+    generator = None
 
     logger.info(f"Starting report generation job {job_id} for {hostname}")
     logger.info(f"Report types to generate: {report_types}")
@@ -71,18 +169,12 @@ async def execute_report_generation(
             raise Exception("Report generator module not available. Please ensure the module is properly installed.")
 
         # Step 1: Initializing
-        await publish_status_update(
-            ws_channel,
-            {
-                "event_type": "status",
-                "job_id": job_id,
-                "data": {
-                    "step": "initializing",
-                    "message": f"Initializing report generator for {hostname}...",
-                    "progress": 5
-                }
-            }
-        )
+        progress.enqueue(_status_event(
+            job_id,
+            "initializing",
+            f"Initializing report generator for {hostname}...",
+            5
+        ))
 
         generator = DeviceReportGenerator()
 
@@ -92,47 +184,28 @@ async def execute_report_generation(
             raise Exception(f"Invalid report types: {invalid}")
 
         # Step 2: Connecting to device
-        await publish_status_update(
-            ws_channel,
-            {
-                "event_type": "status",
-                "job_id": job_id,
-                "data": {
-                    "step": "connecting",
-                    "message": f"Connecting to device {hostname} using PyEZ...",
-                    "progress": 10
-                }
-            }
-        )
+        progress.enqueue(_status_event(
+            job_id,
+            "connecting",
+            f"Connecting to device {hostname} using PyEZ...",
+            10
+        ))
 
-        # Run the synchronous device connection in thread pool
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None,
-            lambda: asyncio.run(generator.generate_reports_for_device(
-                hostname=hostname,
-                username=username,
-                password=password,
-                report_types=report_types
-            ))
+        # The generator is async and offloads its blocking PyEZ calls itself,
+        # so it runs on this loop alongside the status publishers
+        result = await generator.generate_reports_for_device(
+            hostname=hostname,
+            username=username,
+            password=password,
+            report_types=report_types
         )
 
         # Step 3: Process results
-        await publish_status_update(
-            ws_channel,
-            {
-                "event_type": "status",
-                "job_id": job_id,
-                "data": {
-                    "step": "processing",
-                    "message": "Processing report results...",
-                    "progress": 80
-                }
-            }
-        )
+        progress.enqueue(_status_event(job_id, "processing", "Processing report results...", 80))
 
-        # Calculate duration
-        duration = (datetime.now() - start_time).total_seconds()
+        # Calculate duration; the same clock reading stamps the results
+        finished_at = datetime.now()
+        duration = (finished_at - start_time).total_seconds()
 
         # Compile final results
         final_results = {
@@ -146,11 +219,11 @@ async def execute_report_generation(
                 "failed": result.get("failed", 0),
                 "duration": round(duration, 2)
             },
-            "timestamp": datetime.now().isoformat()
+            "timestamp": finished_at.isoformat()
         }
 
-        await publish_status_update(
-            ws_channel,
+        await progress.flush()
+        terminal.enqueue(
             {
                 "event_type": "REPORT_COMPLETE",
                 "job_id": job_id,
@@ -159,19 +232,14 @@ async def execute_report_generation(
         )
 
         # Mark job as finished
-        await publish_status_update(
-            ws_channel,
-            {
-                "event_type": "status",
-                "job_id": job_id,
-                "status": "finished",
-                "data": {
-                    "step": "complete",
-                    "message": f"Report generation complete. Generated {final_results['summary']['successful']} of {total_reports} reports.",
-                    "progress": 100
-                }
-            }
-        )
+        terminal.enqueue(_status_event(
+            job_id,
+            "complete",
+            f"Report generation complete. Generated {final_results['summary']['successful']} of {total_reports} reports.",
+            100,
+            status="finished"
+        ))
+        await terminal.flush()
 
         logger.info(f"Report generation job {job_id} completed successfully")
 
@@ -179,8 +247,8 @@ async def execute_report_generation(
         logger.error(f"Error in report generation job {job_id}: {e}")
 
         # Publish error
-        await publish_status_update(
-            ws_channel,
+        await progress.flush()
+        terminal.enqueue(
             {
                 "event_type": "error",
                 "job_id": job_id,
@@ -191,6 +259,13 @@ async def execute_report_generation(
                 }
             }
         )
+        await terminal.flush()
+
+    finally:
+        if generator is not None:
+            await generator.aclose()
+        await progress.close()
+        await terminal.close()
 
 
 async def publish_status_update(ws_channel: str, message: Dict[str, Any]):
@@ -7,10 +7,10 @@
 # =============================================================================
  
 import asyncio
-import json
+import orjson
 import redis.asyncio as redis
 from loguru import logger
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from pathlib import Path
  
 # Import configuration
@@ -31,20 +31,100 @@ REDIS_PORT = int(settings.REDIS_PORT)
 # Format: ws_channel:job:{job_id}
 REDIS_CHANNEL_PREFIX = "ws_channel:job:"
  
+# Publish pipelining: concurrent PUBLISHes are sharded by channel onto a fixed
+# set of writer tasks, each sending up to PUBLISH_PIPELINE_MAX per round-trip
+PUBLISH_WRITER_COUNT = 4
+PUBLISH_PIPELINE_MAX = 64
+ 
 # =============================================================================
 # SECTION 2: CORE REDIS PUBLISHING FUNCTION
 # =============================================================================
  
+_redis_client: Optional[redis.Redis] = None
+_publish_loop: Optional[asyncio.AbstractEventLoop] = None
+_publish_queues: List[asyncio.Queue] = []
+_publish_writers: List[asyncio.Task] = []
+ 
+ 
+def get_redis_client() -> redis.Redis:
+    """
+    Returns the process-wide async Redis client used for publishing.
+ 
+    The client owns one connection per publish writer, so every PUBLISH in
+    the process shares the same small set of sockets instead of opening
+    (and tearing down) a connection per message.
+    """
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.Redis(
+            connection_pool=redis.ConnectionPool(
+                host=REDIS_HOST,
+                port=REDIS_PORT,
+                decode_responses=True,
+                max_connections=PUBLISH_WRITER_COUNT,
+            )
+        )
+    return _redis_client
+ 
+ 
+async def _publish_writer(queue: asyncio.Queue) -> None:
+    """
+    Drains one publish queue, sending everything waiting in a single pipeline.
+ 
+    Publishes that arrive while a pipeline is in flight queue up and go out
+    together on the next round-trip, so bursts are coalesced automatically.
+    """
+    client = get_redis_client()
+    while True:
+        batch = [await queue.get()]
+        while len(batch) < PUBLISH_PIPELINE_MAX and not queue.empty():
+            batch.append(queue.get_nowait())
+ 
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                for channel, payload, _ in batch:
+                    pipe.publish(channel, payload)
+                results = await pipe.execute()
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            continue
+ 
+        for (_, _, future), subscriber_count in zip(batch, results):
+            if not future.done():
+                future.set_result(subscriber_count)
+ 
+ 
+def _get_publish_queue(channel: str) -> asyncio.Queue:
+    """
+    Returns the writer queue for a channel, starting the writers on first use.
+ 
+    A channel always hashes to the same writer, so messages for one job are
+    published in the order they were submitted.
+    """
+    global _redis_client, _publish_loop
+    loop = asyncio.get_running_loop()
+    if _publish_loop is not loop:
+        # Clients and tasks are bound to the loop that created them
+        _redis_client = None
+        _publish_loop = loop
+        _publish_queues[:] = [asyncio.Queue() for _ in range(PUBLISH_WRITER_COUNT)]
+        _publish_writers[:] = [
+            loop.create_task(_publish_writer(queue)) for queue in _publish_queues
+        ]
+    return _publish_queues[hash(channel) % PUBLISH_WRITER_COUNT]
+ 
+ 
 async def publish_to_redis(channel: str, message: dict) -> bool:
     """
     Publishes a JSON message to a Redis Pub/Sub channel.
  
     ARCHITECTURE:
-    - Creates temporary async Redis connection
-    - Serializes message to JSON
-    - Publishes to specified channel
-    - Logs publication with subscriber count
-    - Closes connection to prevent leaks
+    - Serializes message to JSON bytes with orjson
+    - Hands it to the channel's publish writer, which pipelines it with any
+      other pending PUBLISHes over the shared Redis client
+    - Waits for the pipeline result and logs the subscriber count
  
     CRITICAL: Channel name must match what subscribers expect.
     Frontend subscribes to "job:UUID" and Rust Hub converts to "ws_channel:job:UUID"
@@ -64,20 +144,15 @@ async def publish_to_redis(channel: str, message: dict) -> bool:
     Returns:
         bool: True if published successfully, False otherwise
     """
-    async_r = None
     try:
-        # Create temporary async Redis connection
-        async_r = redis.Redis(
-            host=REDIS_HOST,
-            port=REDIS_PORT,
-            decode_responses=True,
-        )
- 
-        # Serialize message to JSON
-        message_json = json.dumps(message)
+        # Serialize message straight to JSON bytes (non-str keys allowed, as
+        # json.dumps did)
+        message_json = orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS)
  
-        # Publish to channel and get subscriber count
-        subscriber_count = await async_r.publish(channel, message_json)
+        # Queue for the channel's writer and wait for the pipelined PUBLISH
+        future = asyncio.get_running_loop().create_future()
+        _get_publish_queue(channel).put_nowait((channel, message_json, future))
+        subscriber_count = await future
  
         # Log publication result
         event_type = message.get("event_type", "UNKNOWN")
@@ -97,14 +172,6 @@ async def publish_to_redis(channel: str, message: dict) -> bool:
         logger.error(f"❌ Error publishing to Redis channel {channel}: {e}")
         return False
  
-    finally:
-        # Always close connection to prevent resource leaks
-        if async_r:
-            try:
-                await async_r.close()
-            except Exception as close_error:
-                logger.debug(f"Redis close warning: {close_error}")
- 
  
 # =============================================================================
 # SECTION 3: SIMULATION CODE (EXISTING - UNCHANGED)
@@ -78,14 +78,20 @@ async fn handle_socket(socket: WebSocket, state: AppState) {
                 
                 // 2. CORE LOGIC: Handle incoming RedisMessage from the global broadcast
                 Ok(redis_msg) = broadcast_rx.recv() => {
-                    // redis_msg.channel will be "ws_channel:job:UUID"
+                    // redis_msg.channel will be "ws_channel:job:UUID", or a per-event-class
+                    // shard of it such as "ws_channel:job:UUID:progress"
                     let is_subscribed = {
                         let subs = state_clone.connection_manager.subscriptions.lock().await;
                         
                         // This check REQUIRES the stored subscription (sub_channel) 
-                        // to be "ws_channel:job:UUID" to match redis_msg.channel.
+                        // to be "ws_channel:job:UUID"; it matches that channel and
+                        // any ":"-suffixed shard of it.
                         subs.get(&connection_id_clone)
-                            .map(|sub_channel| sub_channel == &redis_msg.channel)
+                            .map(|sub_channel| {
+                                redis_msg.channel
+                                    .strip_prefix(sub_channel.as_str())
+                                    .map_or(false, |rest| rest.is_empty() || rest.starts_with(':'))
+                            })
                             .unwrap_or(false)
                     };
 
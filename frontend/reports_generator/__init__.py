@@ -0,0 +1,7 @@
+from .report_generator import (
+    REPORT_REGISTRY,
+    DeviceReportGenerator,
+    generate_device_reports,
+)
+
+__all__ = ["REPORT_REGISTRY", "DeviceReportGenerator", "generate_device_reports"]
@@ -17,7 +17,7 @@ Report Types:
     - RSVP: RSVP signaling sessions
 
 Usage:
-    from report_generator import DeviceReportGenerator
+    from reports_generator import DeviceReportGenerator
 
     generator = DeviceReportGenerator()
     results = await generator.generate_reports(
@@ -26,26 +26,45 @@ Usage:
         username='admin',
         password='password'
     )
+    await generator.aclose()  # close the pooled device sessions
 
 To add a new report type:
     1. Define the report in the REPORT_REGISTRY below
-    2. Create a parser function following the pattern
-    3. Add the parser to the REPORT_REGISTRY
+    2. Create a parser function following the pattern, or, for a reply that
+       is a flat list of records, a field table and a _RECORD_PARSERS entry
+    3. Add the parser to the REPORT_REGISTRY and to PARSERS
 """
 
 import asyncio
-from typing import Dict, List, Any, Optional, Callable
+import dataclasses
+import functools
+import hashlib
+import itertools
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from types import MappingProxyType, SimpleNamespace
+from typing import (
+    Dict, List, Any, Optional, Callable, FrozenSet, NamedTuple, Tuple, AsyncIterator
+)
 from datetime import datetime
 from jnpr.junos import Device
 from jnpr.junos.exception import ConnectError, RpcError
-import xml.etree.ElementTree as ET
+from jnpr.junos.jxml import normalize_xslt
+from lxml import etree
+from paramiko.common import cMSG_CHANNEL_WINDOW_ADJUST
+from paramiko.message import Message
+
+logger = logging.getLogger(__name__)
+
 
 # =============================================================================
 # REPORT REGISTRY - Easy to add new reports!
 # =============================================================================
 # To add a new report, add an entry here with a parser function
 
-REPORT_REGISTRY = {
+REPORT_REGISTRY = MappingProxyType({
     "device_os": {
         "name": "Device OS",
         "description": "Operating system version and hardware information",
@@ -120,220 +139,472 @@ REPORT_REGISTRY = {
         "timeout": 30,
         "parser": "parse_rsvp"
     },
-}
+})
+
+
+# Maximum number of report RPCs outstanding against one device at a time
+MAX_CONCURRENT_RPCS = 4
+
+# Maximum number of devices with an open NETCONF session at a time
+MAX_CONCURRENT_DEVICES = 32
+
+# Dedicated threads for blocking PyEZ calls (open/close, facts, RPCs), so
+# report jobs neither starve nor are starved by the loop's default executor.
+# Threads are named "pyez_N" to make them easy to spot in stack dumps.
+PYEZ_MAX_WORKERS = int(os.environ.get("PYEZ_MAX_WORKERS", "64"))
+_PYEZ_POOL = ThreadPoolExecutor(max_workers=PYEZ_MAX_WORKERS, thread_name_prefix="pyez")
+
+# Receive window advertised on the NETCONF SSH channel. paramiko's 2 MB
+# default leaves bulky route/extensive-interface replies waiting on window
+# updates over high-latency links.
+SSH_CHANNEL_WINDOW = 16 * 1024 * 1024
 
 
 # =============================================================================
 # REPORT PARSERS - Convert XML RPC responses to structured data
 # =============================================================================
+# PyEZ returns lxml elements, so parsers work on the reply tree directly.
+# Records are found with iter(tag), a tag-filtered C-level descendant walk,
+# rather than through the XPath engine. Replies are normalized, so text needs
+# no stripping here: pooled Devices are built with normalize=True, which makes
+# every RPC on the session normalized, and raw text goes through _NORMALIZE.
 
-def parse_device_os(rpc_response: ET.Element) -> Dict[str, Any]:
-    """Parse device OS information from get-software-information RPC."""
-    software_info = {}
+_NORMALIZE = etree.XSLT(etree.XML(normalize_xslt))
 
-    # Helper to find text with default
-    def find_text(parent, tag, default="Unknown"):
-        elem = parent.findtext(tag, default=default)
-        return elem.strip() if elem else default
 
-    software_info = {
-        "hostname": find_text(rpc_response, "host-name"),
-        "model": find_text(rpc_response, "product-model"),
-        "version": find_text(rpc_response, "junos-version"),
-        "serial_number": find_text(rpc_response, "serial-number"),
-    }
+class _FieldTable(NamedTuple):
+    """
+    How to read one record type: ``fields`` holds (output key, child tag,
+    default) for each value read, ``wanted`` maps each child tag to its output
+    key, ``defaults`` is the record of defaults filled in from the children,
+    and ``record`` is the slotted dataclass to build, if the table has one.
+    """
+    fields: Tuple[Tuple[str, str, str], ...]
+    wanted: Dict[str, str]
+    defaults: Dict[str, str]
+    record: Optional[type]
 
-    return {
-        "software_information": software_info,
-        "format": "structured"
-    }
 
+def _field_table(
+    *fields: Tuple[str, str, str],
+    record: Optional[str] = None,
+    extra: Tuple[str, ...] = ()
+) -> _FieldTable:
+    """
+    Build a field table, precomputing the output key for each child tag it
+    reads and the record of defaults it starts from. With a ``record`` name,
+    also build a slotted dataclass of that name holding the table's fields
+    followed by any ``extra`` ones.
+    """
+    record_type = None
+    if record:
+        record_type = dataclasses.make_dataclass(
+            record,
+            [(key, str) for key, _, _ in fields] + [(key, str) for key in extra],
+            slots=True,
+        )
+        # make_dataclass() only takes module= from Python 3.12
+        record_type.__module__ = __name__
+    return _FieldTable(
+        fields,
+        {tag: key for key, tag, _ in fields},
+        {key: default for key, _, default in fields},
+        record_type,
+    )
 
-def parse_interfaces(rpc_response: ET.Element) -> Dict[str, Any]:
-    """Parse interface information from get-interface-information RPC."""
-    interfaces = []
 
-    for interface in rpc_response.findall(".//physical-interface"):
-        name_elem = interface.find("name")
-        if name_elem is not None and name_elem.text:
-            interface_data = {
-                "name": name_elem.text.strip(),
-                "admin_status": interface.findtext("admin-status", default="Unknown").strip(),
-                "oper_status": interface.findtext("oper-status", default="Unknown").strip(),
-                "description": interface.findtext("description", default="").strip(),
-                "mtu": interface.findtext("mtu", default="Unknown").strip(),
-                "speed": interface.findtext("speed", default="Unknown").strip(),
-                "mac_address": interface.findtext("mac-address", default="Unknown").strip(),
-            }
+# Field tables for each record type. Each record's children are scanned once
+# by _extract() instead of once per field with findtext(). Records that are
+# only ever serialized are slotted dataclasses rather than dicts, which keeps
+# large neighbor/route lists compact; orjson encodes them natively.
+_PHYSICAL_INTERFACE_FIELDS = _field_table(
+    ("name", "name", ""),
+    ("admin_status", "admin-status", "Unknown"),
+    ("oper_status", "oper-status", "Unknown"),
+    ("description", "description", ""),
+    ("mtu", "mtu", "Unknown"),
+    ("speed", "speed", "Unknown"),
+    ("mac_address", "mac-address", "Unknown"),
+)
+_LOGICAL_INTERFACE_FIELDS = _field_table(
+    ("name", "name", ""),
+    ("description", "description", ""),
+)
+_OSPF_NEIGHBOR_FIELDS = _field_table(
+    ("neighbor_id", "neighbor-id", "Unknown"),
+    ("interface", "interface-name", "Unknown"),
+    ("state", "ospf-neighbor-state", "Unknown"),
+    ("priority", "neighbor-priority", "Unknown"),
+    ("dead_time", "neighbor-dead-time", "Unknown"),
+    ("adjacency_state", "adjacency-state", "Unknown"),
+    record="OspfNeighbor",
+)
+_BGP_PEER_FIELDS = _field_table(
+    ("peer_address", "peer-address", "Unknown"),
+    ("peer_as", "peer-as", "Unknown"),
+    ("state", "peer-state", "Unknown"),
+    ("flaps", "flap-count", "0"),
+    ("uptime", "elapsed-time", "Unknown"),
+    ("input_messages", "input-messages", "0"),
+    ("output_messages", "output-messages", "0"),
+    record="BgpPeer",
+)
+_ROUTE_ENTRY_FIELDS = _field_table(
+    ("destination", "rt-destination", "Unknown"),
+    ("protocol", "protocol-name", "Unknown"),
+    ("age", "age", "Unknown"),
+    ("preference", "preference", "Unknown"),
+    record="Route",
+    extra=("next_hop",),
+)
+_LDP_SESSION_FIELDS = _field_table(
+    ("ldp_id", "ldp-neighbor-id", "Unknown"),
+    ("state", "ldp-session-state", "Unknown"),
+    ("uptime", "uptime", "Unknown"),
+    ("interface", "interface-name", "Unknown"),
+    ("connection_state", "connection-state", "Unknown"),
+    record="LdpSession",
+)
+_MPLS_LSP_FIELDS = _field_table(
+    ("name", "lsp-name", "Unknown"),
+    ("state", "lsp-state", "Unknown"),
+    ("path_type", "lsp-path-type", "Unknown"),
+    ("uptime", "uptime", "Unknown"),
+    ("destination", "lsp-dst", "Unknown"),
+    record="MplsLsp",
+)
+_RSVP_SESSION_FIELDS = _field_table(
+    ("destination", "session-dst-addr", "Unknown"),
+    ("state", "session-state", "Unknown"),
+    ("uptime", "uptime", "Unknown"),
+    ("name", "session-name", ""),
+    ("type", "session-type", "Unknown"),
+    record="RsvpSession",
+)
+
+# The record dataclasses, bound under their own names so they pickle (and
+# show up in reprs and tracebacks) as members of this module
+OspfNeighbor = _OSPF_NEIGHBOR_FIELDS.record
+BgpPeer = _BGP_PEER_FIELDS.record
+Route = _ROUTE_ENTRY_FIELDS.record
+LdpSession = _LDP_SESSION_FIELDS.record
+MplsLsp = _MPLS_LSP_FIELDS.record
+RsvpSession = _RSVP_SESSION_FIELDS.record
+
+# A route entry's first next hop sits a level down, at nh/to. Compiled once,
+# this XPath beats findtext()'s per-call path handling.
+_NEXT_HOP_XPATH = etree.XPath("(nh/to)[1]")
+
+# Tags read without a field table
+_DEVICE_OS_TAGS = frozenset({"host-name", "product-model", "junos-version", "serial-number"})
+_ROUTE_TABLE_TAGS = frozenset({"table-name", "destination-count", "route-count"})
+
+
+def _child_texts(element: etree._Element, tags: FrozenSet[str]) -> Dict[str, str]:
+    """
+    Collect the text of the first child with each tag in ``tags`` in a single
+    pass over ``element``'s children. Missing tags are left out; an empty child
+    maps to "" just as findtext() would return it.
+    """
+    texts = {}
+    for child in element:
+        tag = child.tag
+        if tag in tags and tag not in texts:
+            texts[tag] = child.text or ""
+    return texts
 
-            # Add logical interfaces if present
-            logical_interfaces = []
-            for logical in interface.findall(".//logical-interface"):
-                logical_name = logical.find("name")
-                if logical_name is not None:
-                    logical_interfaces.append({
-                        "name": logical_name.text.strip(),
-                        "description": logical.findtext("description", default="").strip()
-                    })
 
-            if logical_interfaces:
-                interface_data["logical_interfaces"] = logical_interfaces
+def _extract(element: etree._Element, table: _FieldTable) -> Dict[str, str]:
+    """
+    Build a record from ``element``'s children as described by a field table,
+    with the table's default for missing children. Each child is dispatched to
+    its output key in a single pass; walking the children last to first lets
+    the first child with a tag win, as findtext() would.
+    """
+    data = table.defaults.copy()
+    get_key = table.wanted.get
+    for child in reversed(element):
+        key = get_key(child.tag)
+        if key is not None:
+            data[key] = child.text or ""
+    return data
 
-            interfaces.append(interface_data)
 
-    return {
-        "interfaces": interfaces,
-        "total_count": len(interfaces),
-        "format": "structured"
-    }
+def _extract_record(element: etree._Element, table: _FieldTable, *extra: str) -> Any:
+    """
+    Like _extract(), but build the table's record dataclass, with ``extra``
+    filling the fields that follow the table's own.
+    """
+    return table.record(*_extract(element, table).values(), *extra)
 
 
-def parse_ospf(rpc_response: ET.Element) -> Dict[str, Any]:
-    """Parse OSPF neighbor information from get-ospf-neighbor-information RPC."""
-    neighbors = []
+def _release(element: etree._Element) -> None:
+    """
+    Free a record that a walk has finished with: clear its subtree and delete
+    the already-visited siblings before it, so the reply shrinks as it is read.
+    """
+    element.clear()
+    while element.getprevious() is not None:
+        del element.getparent()[0]
 
-    for neighbor in rpc_response.findall(".//ospf-neighbor"):
-        neighbor_data = {
-            "neighbor_id": neighbor.findtext("neighbor-id", default="Unknown").strip(),
-            "interface": neighbor.findtext("interface-name", default="Unknown").strip(),
-            "state": neighbor.findtext("ospf-neighbor-state", default="Unknown").strip(),
-            "priority": neighbor.findtext("neighbor-priority", default="Unknown").strip(),
-            "dead_time": neighbor.findtext("neighbor-dead-time", default="Unknown").strip(),
-            "adjacency_state": neighbor.findtext("adjacency-state", default="Unknown").strip(),
-        }
-        neighbors.append(neighbor_data)
+
+def _as_element(rpc_response: Any) -> etree._Element:
+    """
+    Return an RPC reply as an lxml element. PyEZ already hands back normalized
+    elements, which are used as-is; raw XML text or bytes is parsed and run
+    through the same normalization.
+    """
+    if isinstance(rpc_response, etree._Element):
+        return rpc_response
+    if isinstance(rpc_response, str):
+        rpc_response = rpc_response.encode()
+    return _NORMALIZE(etree.fromstring(rpc_response)).getroot()
+
+
+def parse_device_os(rpc_response: etree._Element) -> Dict[str, Any]:
+    """Parse device OS information from get-software-information RPC."""
+    software_info = {}
+
+    texts = _child_texts(rpc_response, _DEVICE_OS_TAGS)
+
+    # Helper to find text with default
+    def find_text(tag, default="Unknown"):
+        elem = texts.get(tag)
+        return elem or default
+
+    software_info = {
+        "hostname": find_text("host-name"),
+        "model": find_text("product-model"),
+        "version": find_text("junos-version"),
+        "serial_number": find_text("serial-number"),
+    }
 
     return {
-        "ospf_neighbors": neighbors,
-        "total_count": len(neighbors),
+        "software_information": software_info,
         "format": "structured"
     }
 
 
-def parse_bgp(rpc_response: ET.Element) -> Dict[str, Any]:
-    """Parse BGP summary information from get-bgp-summary-information RPC."""
-    peers = []
-
-    for peer in rpc_response.findall(".//bgp-peer"):
-        peer_data = {
-            "peer_address": peer.findtext("peer-address", default="Unknown").strip(),
-            "peer_as": peer.findtext("peer-as", default="Unknown").strip(),
-            "state": peer.findtext("peer-state", default="Unknown").strip(),
-            "flaps": peer.findtext("flap-count", default="0").strip(),
-            "uptime": peer.findtext("elapsed-time", default="Unknown").strip(),
-            "input_messages": peer.findtext("input-messages", default="0").strip(),
-            "output_messages": peer.findtext("output-messages", default="0").strip(),
-        }
-        peers.append(peer_data)
+def parse_interfaces(rpc_response: etree._Element) -> Dict[str, Any]:
+    """Parse interface information from get-interface-information RPC."""
+    interfaces = []
+    current = None
+    logical_interfaces = []
+
+    # Bound once: these run for every interface in potentially huge replies
+    extract, release = _extract, _release
+    append_interface = interfaces.append
+
+    # Walk the reply once. Each physical interface opens a record that the
+    # logical interfaces beneath it are added to, and its subtree is released
+    # as the walk leaves it, so large "extensive" replies don't stay resident.
+    for event, element in etree.iterwalk(
+        rpc_response,
+        events=("start", "end"),
+        tag=("physical-interface", "logical-interface"),
+    ):
+        if element.tag == "physical-interface":
+            if event == "start":
+                current = extract(element, _PHYSICAL_INTERFACE_FIELDS)
+                logical_interfaces = []
+                if current["name"]:
+                    current["description"] = current["description"].rstrip()
+                else:
+                    current = None
+            else:
+                if current is not None:
+                    # Add logical interfaces if present
+                    if logical_interfaces:
+                        current["logical_interfaces"] = logical_interfaces
+                    append_interface(current)
+                    current = None
+                release(element)
+
+        elif event == "end" and current is not None:
+            if element.find("name") is not None:
+                logical = extract(element, _LOGICAL_INTERFACE_FIELDS)
+                logical["description"] = logical["description"].rstrip()
+                logical_interfaces.append(logical)
 
     return {
-        "bgp_peers": peers,
-        "total_count": len(peers),
+        "interfaces": interfaces,
+        "total_count": len(interfaces),
         "format": "structured"
     }
 
 
-def parse_routes(rpc_response: ET.Element) -> Dict[str, Any]:
+def parse_routes(rpc_response: etree._Element) -> Dict[str, Any]:
     """Parse routing table information from get-route-information RPC."""
     routes = []
     route_tables = []
+    total_routes_sum = 0
 
-    # Parse route tables first
-    for table in rpc_response.findall(".//route-table"):
-        table_name = table.findtext("table-name", default="Unknown").strip()
-        destinations = table.findtext("destination-count", default="0").strip()
-        total_routes = table.findtext("route-count", default="0").strip()
+    # Parse route tables first, totalling their route counts as we go
+    for table in rpc_response.iter("route-table"):
+        texts = _child_texts(table, _ROUTE_TABLE_TAGS)
+        table_name = texts.get("table-name", "Unknown")
+        destinations = texts.get("destination-count", "0")
+        total_routes = texts.get("route-count", "0")
+        tr = int(total_routes) if total_routes.isdigit() else 0
+        total_routes_sum += tr
 
         route_tables.append({
             "table_name": table_name,
             "destinations": int(destinations) if destinations.isdigit() else 0,
-            "total_routes": int(total_routes) if total_routes.isdigit() else 0
+            "total_routes": tr
         })
 
-    # Parse individual routes (limit to first 100 for performance)
-    count = 0
-    for route in rpc_response.findall(".//rt-entry"):
-        if count >= 100:
-            break
-
-        route_data = {
-            "destination": route.findtext("rt-destination", default="Unknown").strip(),
-            "protocol": route.findtext("protocol-name", default="Unknown").strip(),
-            "age": route.findtext("age", default="Unknown").strip(),
-            "next_hop": route.findtext("nh/to", default="Unknown").strip(),
-            "preference": route.findtext("preference", default="Unknown").strip(),
-        }
-        routes.append(route_data)
-        count += 1
+    # Parse individual routes (limit to first 100 for performance). The walk is
+    # lazy, so islice stops it at the limit, and each entry is released once read.
+    extract_record, next_hop_of, release = _extract_record, _NEXT_HOP_XPATH, _release
+    append_route = routes.append
+    route_walk = etree.iterwalk(rpc_response, events=("end",), tag="rt-entry")
+    for _, route in itertools.islice(route_walk, 100):
+        # nh/to is a grandchild, so it is looked up with its own XPath
+        next_hop = next_hop_of(route)
+        next_hop = (next_hop[0].text or "") if next_hop else "Unknown"
+        append_route(extract_record(route, _ROUTE_ENTRY_FIELDS, next_hop))
+        release(route)
 
     return {
         "route_tables": route_tables,
         "routes": routes,
-        "total_routes": sum(rt["total_routes"] for rt in route_tables),
+        "total_routes": total_routes_sum,
         "format": "structured"
     }
 
 
-def parse_ldp(rpc_response: ET.Element) -> Dict[str, Any]:
-    """Parse LDP session information from get-ldp-session-information RPC."""
-    sessions = []
-
-    for session in rpc_response.findall(".//ldp-session"):
-        session_data = {
-            "ldp_id": session.findtext("ldp-neighbor-id", default="Unknown").strip(),
-            "state": session.findtext("ldp-session-state", default="Unknown").strip(),
-            "uptime": session.findtext("uptime", default="Unknown").strip(),
-            "interface": session.findtext("interface-name", default="Unknown").strip(),
-            "connection_state": session.findtext("connection-state", default="Unknown").strip(),
-        }
-        sessions.append(session_data)
+def _parse_records(
+    rpc_response: etree._Element,
+    tag: str,
+    table: _FieldTable,
+    out_key: str
+) -> Dict[str, Any]:
+    """
+    Parse a reply that is a flat list of ``tag`` records, one field-table
+    record each, returned under ``out_key``.
+    """
+    extract_record = _extract_record
+    records = [extract_record(record, table) for record in rpc_response.iter(tag)]
 
     return {
-        "ldp_sessions": sessions,
-        "total_count": len(sessions),
+        out_key: records,
+        "total_count": len(records),
         "format": "structured"
     }
 
 
-def parse_mpls(rpc_response: ET.Element) -> Dict[str, Any]:
-    """Parse MPLS LSP information from get-mpls-lsp-information RPC."""
-    lsps = []
+# Reports whose reply is a flat list of records share _parse_records; each
+# is described by (record tag, field table, output key)
+_RECORD_PARSERS: Dict[str, Tuple[str, _FieldTable, str]] = {
+    "parse_ospf": ("ospf-neighbor", _OSPF_NEIGHBOR_FIELDS, "ospf_neighbors"),
+    "parse_bgp": ("bgp-peer", _BGP_PEER_FIELDS, "bgp_peers"),
+    "parse_ldp": ("ldp-session", _LDP_SESSION_FIELDS, "ldp_sessions"),
+    "parse_mpls": ("mpls-lsp", _MPLS_LSP_FIELDS, "mpls_lsps"),
+    "parse_rsvp": ("rsvp-session", _RSVP_SESSION_FIELDS, "rsvp_sessions"),
+}
 
-    for lsp in rpc_response.findall(".//mpls-lsp"):
-        lsp_data = {
-            "name": lsp.findtext("lsp-name", default="Unknown").strip(),
-            "state": lsp.findtext("lsp-state", default="Unknown").strip(),
-            "path_type": lsp.findtext("lsp-path-type", default="Unknown").strip(),
-            "uptime": lsp.findtext("uptime", default="Unknown").strip(),
-            "destination": lsp.findtext("lsp-dst", default="Unknown").strip(),
-        }
-        lsps.append(lsp_data)
 
-    return {
-        "mpls_lsps": lsps,
-        "total_count": len(lsps),
-        "format": "structured"
-    }
+# Parser functions by the name REPORT_REGISTRY refers to them by, so dispatch
+# is a dict lookup rather than a globals() search on every report. Parsers are
+# resolved into _COMPILED_REGISTRY at import, so this table is edited here,
+# alongside the registry, and is not a runtime extension point.
+PARSERS: Dict[str, Callable[[etree._Element], Dict[str, Any]]] = {
+    "parse_device_os": parse_device_os,
+    "parse_interfaces": parse_interfaces,
+    "parse_routes": parse_routes,
+    **{
+        name: functools.partial(_parse_records, tag=tag, table=table, out_key=out_key)
+        for name, (tag, table, out_key) in _RECORD_PARSERS.items()
+    },
+}
+
+# Everything generate_report needs from a registry entry, resolved once:
+# PyEZ exposes each RPC as a device.rpc method named with underscores, and
+# the parser name is looked up in PARSERS here rather than per report
+_COMPILED_REGISTRY: Dict[str, SimpleNamespace] = {
+    report_id: SimpleNamespace(
+        name=config["name"],
+        description=config["description"],
+        rpc=config["rpc"],
+        rpc_attr=config["rpc"].replace("-", "_"),
+        rpc_args=config.get("rpc_args", {}),
+        parser_name=config["parser"],
+        parser=PARSERS.get(config["parser"]),
+    )
+    for report_id, config in REPORT_REGISTRY.items()
+}
 
 
-def parse_rsvp(rpc_response: ET.Element) -> Dict[str, Any]:
-    """Parse RSVP session information from get-rsvp-session-information RPC."""
-    sessions = []
+async def _run_blocking(func: Callable, *args, **kwargs) -> Any:
+    """Run a blocking PyEZ call on the PyEZ thread pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_PYEZ_POOL, functools.partial(func, *args, **kwargs))
 
-    for session in rpc_response.findall(".//rsvp-session"):
-        session_data = {
-            "destination": session.findtext("session-dst-addr", default="Unknown").strip(),
-            "state": session.findtext("session-state", default="Unknown").strip(),
-            "uptime": session.findtext("uptime", default="Unknown").strip(),
-            "name": session.findtext("session-name", default="").strip(),
-            "type": session.findtext("session-type", default="Unknown").strip(),
-        }
-        sessions.append(session_data)
 
+def _widen_ssh_window(device: Device) -> None:
+    """
+    Grow the receive window of an open device's NETCONF SSH channel.
+
+    ncclient opens the channel with paramiko's default window and offers no
+    setting for it, so raise the channel's window and advertise the extra
+    space to the server with a WINDOW_ADJUST, as paramiko's own Channel.recv
+    does. Best effort: if the session internals differ, the default is kept
+    and the failure is logged at debug level.
+    """
+    try:
+        channel = device._conn._session._channel
+        extra = SSH_CHANNEL_WINDOW - channel.in_window_size
+        if extra <= 0:
+            return
+        with channel.lock:
+            channel.in_window_size = SSH_CHANNEL_WINDOW
+            channel.in_window_threshold = SSH_CHANNEL_WINDOW // 10
+        m = Message()
+        m.add_byte(cMSG_CHANNEL_WINDOW_ADJUST)
+        m.add_int(channel.remote_chanid)
+        m.add_int(extra)
+        channel.transport._send_user_message(m)
+    except Exception as e:
+        logger.debug(f"[{device.hostname}] Could not widen the NETCONF SSH window: {e!r}")
+
+
+def _open_device(device: Device) -> None:
+    """Open a NETCONF session sized for large report replies."""
+    device.open()
+    _widen_ssh_window(device)
+
+
+# Pool key for a NETCONF session: host, user, port and a digest of the
+# password, so a session is only reused for the credentials that opened it
+_SessionKey = Tuple[str, str, int, bytes]
+
+
+def _session_key(host: str, user: str, password: str, port: int) -> _SessionKey:
+    """Build the pool key for a session without keeping the password itself."""
+    return (host, user, port, hashlib.sha256(password.encode()).digest())
+
+
+@dataclasses.dataclass
+class _PooledSession:
+    """
+    An open pooled Device, the RPC cap shared by everyone using it, and how
+    many batches are borrowing it right now.
+    """
+    device: Device
+    rpc_slots: asyncio.Semaphore
+    borrowers: int = 0
+    broken: bool = False
+
+
+def _read_device_info(device: Device, hostname: str) -> Dict[str, Any]:
+    """Read the facts shown in report summaries from a connected device."""
+    facts = device.facts
     return {
-        "rsvp_sessions": sessions,
-        "total_count": len(sessions),
-        "format": "structured"
+        "hostname": facts.get("hostname", hostname),
+        "model": facts.get("model", "Unknown"),
+        "version": facts.get("version", "Unknown"),
+        "serial": facts.get("serialnumber", "Unknown")
     }
 
 
@@ -353,6 +624,103 @@ class DeviceReportGenerator:
         """Initialize the report generator."""
         self.report_types = list(REPORT_REGISTRY.keys())
 
+        # Open NETCONF sessions kept across report batches, and a lock per
+        # key so a session is opened once. A key's lock is dropped again when
+        # its session is evicted, so keys seen once don't accumulate.
+        self._device_pool: Dict[_SessionKey, _PooledSession] = {}
+        self._device_locks: Dict[_SessionKey, asyncio.Lock] = {}
+
+    async def _get_session(
+        self,
+        host: str,
+        user: str,
+        password: str,
+        port: int
+    ) -> _PooledSession:
+        """
+        Borrow the pooled session for the host and credentials, reusing it when
+        it is still up and opening (and pooling) a new one otherwise. A session
+        replaced here is closed by its last borrower in _release_session().
+        """
+        key = _session_key(host, user, password, port)
+        lock = self._device_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            session = self._device_pool.get(key)
+            if session is not None and session.device.connected and not session.broken:
+                session.borrowers += 1
+                return session
+
+            # Normalize for the whole session rather than per call: a per-call
+            # normalize=True swaps dev.transform for the duration of the call,
+            # which races with the other RPCs in flight on the same session
+            device = Device(
+                host=host, user=user, password=password, port=port, normalize=True
+            )
+            await _run_blocking(_open_device, device)
+            session = _PooledSession(device, asyncio.Semaphore(MAX_CONCURRENT_RPCS))
+            session.borrowers = 1
+            self._device_pool[key] = session
+            return session
+
+    async def _release_session(self, key: _SessionKey, session: _PooledSession) -> None:
+        """
+        Return a borrowed session. Once nobody holds it, a session that has
+        failed or been replaced in the pool is evicted and closed. A failed
+        close is only logged, so it never masks the error that broke the
+        session.
+        """
+        session.borrowers -= 1
+        pooled = self._device_pool.get(key) is session
+        if session.borrowers or (pooled and not session.broken):
+            return
+        if pooled:
+            del self._device_pool[key]
+        # Nothing is pooled under the key now; its lock can go too unless a
+        # caller is opening a new session under it
+        lock = self._device_locks.get(key)
+        if key not in self._device_pool and lock is not None and not lock.locked():
+            del self._device_locks[key]
+        if session.device.connected:
+            try:
+                await _run_blocking(session.device.close)
+            except Exception as e:
+                logger.warning(f"[{key[0]}] Error closing evicted session: {e!r}")
+
+    @asynccontextmanager
+    async def _managed_device(
+        self,
+        host: str,
+        user: str,
+        password: str,
+        port: int
+    ) -> AsyncIterator[_PooledSession]:
+        """
+        Lend out the pooled session for a host for the length of the block.
+        The session stays open when the block exits cleanly. If the block
+        raises, the session's state is unknown: it is marked broken, handed to
+        no new borrowers, and closed once the last current borrower is done.
+        Otherwise it is closed by aclose().
+        """
+        session = await self._get_session(host, user, password, port)
+        try:
+            yield session
+        except Exception:
+            session.broken = True
+            raise
+        finally:
+            await self._release_session(_session_key(host, user, password, port), session)
+
+    async def aclose(self):
+        """Close every pooled device session."""
+        pool, self._device_pool = self._device_pool, {}
+        self._device_locks = {}
+        for session in pool.values():
+            if session.device.connected:
+                try:
+                    await _run_blocking(session.device.close)
+                except Exception:
+                    pass
+
     def get_available_reports(self) -> List[Dict[str, Any]]:
         """
         Get list of all available report types.
@@ -378,10 +746,11 @@ class DeviceReportGenerator:
         Returns:
             Report configuration dict or None if not found
         """
-        if report_id in REPORT_REGISTRY:
+        report_config = REPORT_REGISTRY.get(report_id)
+        if report_config is not None:
             return {
                 "id": report_id,
-                **REPORT_REGISTRY[report_id]
+                **report_config
             }
         return None
 
@@ -398,10 +767,35 @@ class DeviceReportGenerator:
         invalid = [rt for rt in report_types if rt not in REPORT_REGISTRY]
         return (len(invalid) == 0, invalid)
 
+    def _run_rpc_sync(self, device: Device, report: SimpleNamespace) -> Dict[str, Any]:
+        """
+        Execute one report's RPC and parse the reply (blocking).
+
+        Args:
+            device: Connected PyEZ Device object
+            report: Compiled registry entry for the report
+
+        Returns:
+            Parsed report data
+        """
+        # A registry entry naming an unknown parser is a bug; fail the report
+        # before spending an RPC on it
+        if report.parser is None:
+            raise KeyError(f"Parser {report.parser_name} not found")
+
+        # Execute the RPC; the session is normalized, so the reply text is
+        # already whitespace-clean
+        rpc_method = getattr(device.rpc, report.rpc_attr)
+        rpc_response = _as_element(rpc_method(**report.rpc_args))
+
+        # Parse the response
+        return report.parser(rpc_response)
+
     async def generate_report(
         self,
         device: Device,
-        report_type: str
+        report_type: str,
+        timestamp: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Generate a single report type for a device.
@@ -409,48 +803,31 @@ class DeviceReportGenerator:
         Args:
             device: Connected PyEZ Device object
             report_type: Report type ID to generate
+            timestamp: ISO timestamp shared by the batch (default: now)
 
         Returns:
             Structured report data
         """
-        if report_type not in REPORT_REGISTRY:
+        report = _COMPILED_REGISTRY.get(report_type)
+        if report is None:
             return {
                 "status": "error",
                 "error": f"Unknown report type: {report_type}",
                 "timestamp": datetime.now().isoformat()
             }
 
-        report_config = REPORT_REGISTRY[report_type]
-
         try:
-            # Execute RPC call
-            rpc_args = report_config.get("rpc_args", {})
-
-            # Execute RPC with normalize=True to get structured data
-            if rpc_args:
-                rpc_response = device.rpc(report_config["rpc"], normalize=True, **rpc_args)
-            else:
-                rpc_response = device.rpc(report_config["rpc"], normalize=True)
-
-            # Parse the response
-            parser_func = globals().get(report_config["parser"])
-            if parser_func:
-                report_data = parser_func(rpc_response)
-            else:
-                # Default: return as XML string
-                xml_str = ET.tostring(rpc_response, encoding='unicode')
-                report_data = {
-                    "raw_xml": xml_str,
-                    "format": "xml"
-                }
+            # The RPC blocks on the NETCONF session and the parse is pure CPU,
+            # so run both together off the event loop
+            report_data = await _run_blocking(self._run_rpc_sync, device, report)
 
             return {
                 "status": "success",
-                "name": report_config["name"],
-                "description": report_config["description"],
-                "rpc": report_config["rpc"],
+                "name": report.name,
+                "description": report.description,
+                "rpc": report.rpc,
                 "data": report_data,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp or datetime.now().isoformat()
             }
 
         except RpcError as e:
@@ -472,7 +849,8 @@ class DeviceReportGenerator:
         username: str,
         password: str,
         report_types: List[str],
-        port: int = 22
+        port: int = 22,
+        timestamp: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Generate multiple reports for a single device.
@@ -483,12 +861,14 @@ class DeviceReportGenerator:
             password: SSH password
             report_types: List of report type IDs
             port: SSH port (default: 22)
+            timestamp: ISO timestamp shared by the batch (default: now)
 
         Returns:
             Dictionary with all report results
         """
-        device = None
         results = {}
+        # One timestamp for the device and all of its successful reports
+        ts = timestamp or datetime.now().isoformat()
 
         try:
             # Validate report types
@@ -501,38 +881,41 @@ class DeviceReportGenerator:
                     "reports": {}
                 }
 
-            # Connect to device
-            device = Device(
-                host=hostname,
-                user=username,
-                password=password,
-                port=port
-            )
-            device.open()
-
-            # Get device facts
-            facts = device.facts
-            device_info = {
-                "hostname": facts.get("hostname", hostname),
-                "model": facts.get("model", "Unknown"),
-                "version": facts.get("version", "Unknown"),
-                "serial": facts.get("serialnumber", "Unknown")
-            }
-
-            # Generate each report
-            for report_type in report_types:
-                result = await self.generate_report(device, report_type)
-                results[report_type] = result
+            # Borrow the pooled session for the host (opening one if needed);
+            # it is evicted and closed if anything below fails
+            async with self._managed_device(hostname, username, password, port) as session:
+                device = session.device
+
+                # Get device facts. Reading them may run fact-gathering RPCs, so do
+                # it once off the event loop and keep a plain dict.
+                device_info = await _run_blocking(_read_device_info, device, hostname)
+
+                # Generate the reports concurrently over the same session. The cap
+                # belongs to the pooled session, so a device never has more than
+                # MAX_CONCURRENT_RPCS in flight however many batches share it.
+                # ncclient matches replies to requests by message-id, but PyEZ keeps
+                # per-Device state too: this is only safe because the session is
+                # normalized at construction, so no RPC swaps dev.transform.
+                rpc_slots = session.rpc_slots
+
+                async def run_report(report_type: str) -> Dict[str, Any]:
+                    async with rpc_slots:
+                        return await self.generate_report(device, report_type, ts)
+
+                report_results = await asyncio.gather(
+                    *(run_report(report_type) for report_type in report_types)
+                )
+                results = dict(zip(report_types, report_results))
 
-            return {
-                "hostname": hostname,
-                "device_info": device_info,
-                "reports": results,
-                "total_reports": len(report_types),
-                "successful": sum(1 for r in results.values() if r.get("status") == "success"),
-                "failed": sum(1 for r in results.values() if r.get("status") == "error"),
-                "timestamp": datetime.now().isoformat()
-            }
+                return {
+                    "hostname": hostname,
+                    "device_info": device_info,
+                    "reports": results,
+                    "total_reports": len(report_types),
+                    "successful": sum(1 for r in results.values() if r.get("status") == "success"),
+                    "failed": sum(1 for r in results.values() if r.get("status") == "error"),
+                    "timestamp": ts
+                }
 
         except ConnectError as e:
             return {
@@ -548,9 +931,6 @@ class DeviceReportGenerator:
                 "error": f"Unexpected error: {str(e)}",
                 "reports": {}
             }
-        finally:
-            if device and device.connected:
-                device.close()
 
     async def generate_reports(
         self,
@@ -573,23 +953,44 @@ class DeviceReportGenerator:
         Returns:
             Dictionary with results for all devices
         """
-        overall_results = {}
+        # Work on the devices concurrently so their SSH/NETCONF round-trips
+        # overlap, capped to keep the number of open sessions bounded
+        device_slots = asyncio.Semaphore(MAX_CONCURRENT_DEVICES)
+        # One timestamp for the whole batch
+        ts = datetime.now().isoformat()
+
+        async def run_device(device_hostname: str) -> Dict[str, Any]:
+            async with device_slots:
+                return await self.generate_reports_for_device(
+                    device_hostname,
+                    username,
+                    password,
+                    report_types,
+                    port,
+                    ts
+                )
 
-        for device_hostname in devices:
-            result = await self.generate_reports_for_device(
-                device_hostname,
-                username,
-                password,
-                report_types,
-                port
-            )
+        device_results = await asyncio.gather(
+            *(run_device(device_hostname) for device_hostname in devices),
+            return_exceptions=True
+        )
+
+        overall_results = {}
+        for device_hostname, result in zip(devices, device_results):
+            if isinstance(result, BaseException):
+                result = {
+                    "hostname": device_hostname,
+                    "status": "error",
+                    "error": f"Unexpected error: {str(result)}",
+                    "reports": {}
+                }
             overall_results[device_hostname] = result
 
         return {
             "devices": overall_results,
             "total_devices": len(devices),
             "report_types": report_types,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": ts,
             "summary": {
                 "total_reports": len(devices) * len(report_types),
                 "successful": sum(
@@ -637,9 +1038,12 @@ async def generate_device_reports(
         )
     """
     generator = DeviceReportGenerator()
-    return await generator.generate_reports(
-        devices, report_types, username, password, port
-    )
+    try:
+        return await generator.generate_reports(
+            devices, report_types, username, password, port
+        )
+    finally:
+        await generator.aclose()
 
 
 # =============================================================================
@@ -649,7 +1053,8 @@ async def generate_device_reports(
 if __name__ == "__main__":
     import asyncio
     from getpass import getpass
-    import json
+    import time
+    import orjson
 
     async def main():
         generator = DeviceReportGenerator()
@@ -685,23 +1090,27 @@ if __name__ == "__main__":
         print("Generating reports...")
         print("=" * 60)
 
-        results = await generator.generate_reports(
-            devices=devices,
-            report_types=report_types,
-            username=username,
-            password=password
-        )
+        try:
+            results = await generator.generate_reports(
+                devices=devices,
+                report_types=report_types,
+                username=username,
+                password=password
+            )
+        finally:
+            await generator.aclose()
 
         # Display results
         print("\n" + "=" * 60)
         print("Results:")
         print("=" * 60)
-        print(json.dumps(results, indent=2, default=str))
+        output = orjson.dumps(results, option=orjson.OPT_INDENT_2, default=str)
+        print(output.decode())
 
-        # Save to file
-        output_file = f"device_reports_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        # Save to file, writing the encoded bytes as-is
+        output_file = f"device_reports_{time.strftime('%Y%m%d_%H%M%S')}.json"
+        with open(output_file, 'wb') as f:
+            f.write(output)
         print(f"\nResults saved to: {output_file}")
 
     try:
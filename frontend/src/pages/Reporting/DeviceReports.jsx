@@ -126,59 +126,77 @@ export default function DeviceReports() {
 
             if (!isJobMessage) return;
 
-            console.log('🔍 [DeviceReports] Processing job message:', messageData);
-
-            let normalizedLog;
-            try {
-                normalizedLog = processLogMessage(messageData);
-            } catch (processorError) {
-                console.error('❌ [DeviceReports] Log processor error:', processorError);
-                normalizedLog = {
-                    id: Date.now() + '-' + Math.random().toString(36).substr(2, 9),
-                    timestamp: new Date().toLocaleTimeString(),
-                    type: 'INFO',
-                    message: 'Processing report generation message...',
-                    isTechnical: false,
-                    originalEvent: messageData
-                };
+            // Status updates may arrive coalesced as {"batch": [...]}; unpack them
+            // so each event is handled exactly as if it had been published alone.
+            let payload = messageData.data;
+            if (typeof payload === 'string') {
+                try {
+                    payload = JSON.parse(payload);
+                } catch {
+                    payload = null;
+                }
             }
-            setExecutionLogs(prev => [...prev, normalizedLog]);
+            const jobEvents = Array.isArray(payload?.batch)
+                ? payload.batch.map(event => ({ ...messageData, data: event }))
+                : [messageData];
+
+            const handleJobEvent = (jobMessage) => {
+                console.log('🔍 [DeviceReports] Processing job message:', jobMessage);
+
+                let normalizedLog;
+                try {
+                    normalizedLog = processLogMessage(jobMessage);
+                } catch (processorError) {
+                    console.error('❌ [DeviceReports] Log processor error:', processorError);
+                    normalizedLog = {
+                        id: Date.now() + '-' + Math.random().toString(36).substr(2, 9),
+                        timestamp: new Date().toLocaleTimeString(),
+                        type: 'INFO',
+                        message: 'Processing report generation message...',
+                        isTechnical: false,
+                        originalEvent: jobMessage
+                    };
+                }
+                setExecutionLogs(prev => [...prev, normalizedLog]);
 
-            const originalEvent = normalizedLog.originalEvent;
+                const originalEvent = normalizedLog.originalEvent;
 
-            if (normalizedLog.type === 'STEP_PROGRESS') {
-                const stepName = normalizedLog.message.replace(/^Step \d+: /, '');
-                setActiveExecutionStep(stepName);
-            }
+                if (normalizedLog.type === 'STEP_PROGRESS') {
+                    const stepName = normalizedLog.message.replace(/^Step \d+: /, '');
+                    setActiveExecutionStep(stepName);
+                }
 
-            if (originalEvent?.data?.progress !== undefined) {
-                const progress = parseFloat(originalEvent.data.progress);
-                if (!isNaN(progress) && progress >= 0 && progress <= 100) {
-                    setExecutionProgress(progress);
+                if (originalEvent?.data?.progress !== undefined) {
+                    const progress = parseFloat(originalEvent.data.progress);
+                    if (!isNaN(progress) && progress >= 0 && progress <= 100) {
+                        setExecutionProgress(progress);
+                    }
                 }
-            }
 
-            if (normalizedLog.type === 'SUCCESS' && originalEvent?.event_type === 'REPORT_COMPLETE') {
-                console.log('✅ [DeviceReports] Report generation completed successfully');
-                if (originalEvent.data) {
-                    setReportResults(originalEvent.data);
+                if (normalizedLog.type === 'SUCCESS' && originalEvent?.event_type === 'REPORT_COMPLETE') {
+                    console.log('✅ [DeviceReports] Report generation completed successfully');
+                    if (originalEvent.data) {
+                        setReportResults(originalEvent.data);
+                    }
                 }
-            }
 
-            if (originalEvent?.status === 'finished' || originalEvent?.type === 'job_status') {
-                console.log('🎉 [DeviceReports] Report generation completed');
-                setExecutionComplete(true);
-                setIsExecuting(false);
-                setExecutionProgress(100);
-                setCurrentStep(4);
-            }
+                if (originalEvent?.status === 'finished' || originalEvent?.type === 'job_status') {
+                    console.log('🎉 [DeviceReports] Report generation completed');
+                    setExecutionComplete(true);
+                    setIsExecuting(false);
+                    setExecutionProgress(100);
+                    setCurrentStep(4);
+                }
 
-            if (normalizedLog.type === 'ERROR') {
-                console.log('❌ [DeviceReports] Report generation failed');
-                setError(normalizedLog.message || 'Report generation failed');
-                setIsExecuting(false);
-                setExecutionComplete(true);
-            }
+                if (normalizedLog.type === 'ERROR') {
+                    console.log('❌ [DeviceReports] Report generation failed');
+                    setError(normalizedLog.message || 'Report generation failed');
+                    setIsExecuting(false);
+                    setExecutionComplete(true);
+                }
+            };
+
+            jobEvents.forEach(handleJobEvent);
 
         } catch (error) {
             console.error('❌ [DeviceReports] Error processing message:', error);